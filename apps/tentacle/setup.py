@@ -38,6 +38,7 @@ setup(
         "rich>=13.7.0",
         "python-dotenv>=1.0.0",
         "structlog>=23.2.0",
+        "orjson>=3.9.10",
         "httpx>=0.25.2",
         "cryptography>=43.0.1",
     ],
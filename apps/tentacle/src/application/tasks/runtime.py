@@ -33,6 +33,7 @@ from src.domain.tasks.ports import (
     TaskExecutionTreePort,
     TaskExecutionEventBusPort,
     TaskExecutionEventStreamPort,
+    TaskExecutionEventSubscription,
     TaskSchedulerPort,
     TaskConversationPort,
     PreferenceLearningPort,
@@ -993,9 +994,7 @@ class TaskRuntime:
             }
             return
 
-        if not self._execution_event_stream:
-            self._execution_event_stream = TaskExecutionEventStreamAdapter()
-        subscription = await self._execution_event_stream.subscribe(task_id)
+        subscription = await self.subscribe_events(task_id)
 
         try:
             heartbeat_interval = 30
@@ -1024,6 +1023,11 @@ class TaskRuntime:
         finally:
             await subscription.close()
 
+    async def subscribe_events(self, task_id: str) -> TaskExecutionEventSubscription:
+        if not self._execution_event_stream:
+            self._execution_event_stream = TaskExecutionEventStreamAdapter()
+        return await self._execution_event_stream.subscribe(task_id)
+
     async def link_conversation(self, task_id: str, conversation_id: str) -> None:
         await self._ensure_initialized()
         await self._conversation_port.link_task_to_conversation(
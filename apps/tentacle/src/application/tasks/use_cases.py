@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any, List, AsyncGenerator
 
 from src.domain.tasks.models import Task, TaskStatus
-from src.domain.tasks.ports import TaskOperationsPort
+from src.domain.tasks.ports import TaskExecutionEventSubscription, TaskOperationsPort
 
 
 @dataclass
@@ -103,6 +103,9 @@ class TaskUseCases:
             user_id=user_id,
         )
 
+    async def subscribe_events(self, task_id: str) -> TaskExecutionEventSubscription:
+        return await self.task_ops.subscribe_events(task_id)
+
     async def link_conversation(self, task_id: str, conversation_id: str) -> None:
         await self.task_ops.link_conversation(
             task_id=task_id,
@@ -2,6 +2,9 @@
 # - Beat schedule is hard-coded in code; operational changes require deploys.
 from celery import Celery
 from src.core.config import settings
+from src.core.logging_config import configure_logging
+
+configure_logging()
 
 # Create Celery app
 app = Celery(
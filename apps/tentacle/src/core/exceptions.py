@@ -1,61 +1,65 @@
 """
 Core exceptions for the Tentacle system.
+
+Every class declares empty ``__slots__`` so instances do not carry a
+``__weakref__`` slot; ``BaseException`` still provides ``args`` and a
+lazily created ``__dict__`` for ad-hoc attributes.
 """
 
 
 class TentacleException(Exception):
     """Base exception for all Tentacle errors"""
-    pass
+    __slots__ = ()
 
 
 class AgentExecutionError(TentacleException):
     """Error during agent execution"""
-    pass
+    __slots__ = ()
 
 
 class ValidationError(TentacleException):
     """Validation error"""
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(TentacleException):
     """Configuration error"""
-    pass
+    __slots__ = ()
 
 
 # Capability-related exceptions
 class CapabilityError(TentacleException):
     """Base capability error"""
-    pass
+    __slots__ = ()
 
 
 class CapabilityNotFoundError(CapabilityError):
     """Capability not found in registry"""
-    pass
+    __slots__ = ()
 
 
 class CapabilityBindingError(CapabilityError):
     """Error binding capability to agent"""
-    pass
+    __slots__ = ()
 
 
 # LLM-related exceptions
 class LLMError(TentacleException):
     """LLM operation error"""
-    pass
+    __slots__ = ()
 
 
 class PromptError(LLMError):
     """Prompt-related error"""
-    pass
+    __slots__ = ()
 
 
 # State-related exceptions
 class StateError(TentacleException):
     """State management error"""
-    pass
+    __slots__ = ()
 
 
 class BudgetError(TentacleException):
     """Budget-related error"""
-    pass
+    __slots__ = ()
@@ -0,0 +1,59 @@
+"""Structlog configuration shared by the API and Celery processes."""
+
+import json
+import logging
+import sys
+from typing import Any
+
+import orjson
+import structlog
+
+from src.core.config import settings
+
+
+def _log_level() -> int:
+    level = logging.getLevelName(str(settings.LOG_LEVEL).upper())
+    return level if isinstance(level, int) else logging.INFO
+
+
+def _render_json(event_dict: Any, **kwargs: Any) -> bytes:
+    # Accept non-str keys like the stdlib encoder. orjson rejects integers
+    # beyond 64 bits without consulting ``default``, so render those events
+    # with the stdlib encoder instead of raising into the caller.
+    try:
+        return orjson.dumps(event_dict, option=orjson.OPT_NON_STR_KEYS, **kwargs)
+    except TypeError:
+        return json.dumps(event_dict, default=repr).encode()
+
+
+def configure_logging() -> None:
+    """Configure structlog for production use.
+
+    Loggers filter by level at bind time, render JSON with orjson and write
+    the bytes straight to stdout without going through stdlib ``logging``,
+    and are assembled once per ``get_logger()`` proxy on first use. Set
+    ``DEBUG=true`` for console output instead of JSON lines.
+    """
+    processors = [
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+        structlog.processors.StackInfoRenderer(),
+    ]
+    if settings.DEBUG:
+        processors.append(structlog.dev.ConsoleRenderer())
+        logger_factory = structlog.WriteLoggerFactory(file=sys.stdout)
+    else:
+        # orjson renders straight to bytes, so write them without re-encoding.
+        processors += [
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=_render_json),
+        ]
+        logger_factory = structlog.BytesLoggerFactory(file=sys.stdout.buffer)
+
+    structlog.configure(
+        processors=processors,
+        wrapper_class=structlog.make_filtering_bound_logger(_log_level()),
+        logger_factory=logger_factory,
+        cache_logger_on_first_use=True,
+    )
@@ -42,6 +42,11 @@ from src.domain.tasks.models import (
     TaskStatus,
     TaskStep,
 )
+from src.domain.tasks.status_values import (
+    ACTIVE_TASK_STATUS_VALUES,
+    TERMINAL_TASK_STATUS_VALUES,
+    task_status_value,
+)
 from src.domain.tasks.planning_helpers import assign_parallel_groups
 from src.domain.tasks.risk_detector import RiskDetectorService, RiskAssessment, RiskLevel
 from src.domain.tasks.errors import InvalidTransitionError
@@ -88,4 +93,7 @@ __all__ = [
     "TaskException",
     "TaskStatus",
     "TaskStep",
+    "ACTIVE_TASK_STATUS_VALUES",
+    "TERMINAL_TASK_STATUS_VALUES",
+    "task_status_value",
 ]
@@ -79,6 +79,9 @@ class TaskOperationsPort(Protocol):
     ) -> AsyncGenerator[Dict[str, Any], None]:
         ...
 
+    async def subscribe_events(self, task_id: str) -> TaskExecutionEventSubscription:
+        ...
+
     async def link_conversation(self, task_id: str, conversation_id: str) -> None:
         ...
 
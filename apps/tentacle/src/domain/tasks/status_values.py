@@ -0,0 +1,37 @@
+"""Normalized task status values shared by the task tools."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from src.domain.tasks.models import TaskStatus
+
+
+def task_status_value(status: Any) -> str:
+    """Return the lowercase string value of a task or step status."""
+    if status is None:
+        return "unknown"
+    raw = getattr(status, "value", status)
+    if type(raw) is str:
+        # Stores usually hand back already-lowercase strings; skip the copy.
+        return raw if raw.islower() else raw.lower()
+    return str(raw).lower() if raw is not None else "unknown"
+
+
+ACTIVE_TASK_STATUS_VALUES = frozenset(
+    task_status_value(s)
+    for s in (
+        TaskStatus.PLANNING,
+        TaskStatus.READY,
+        TaskStatus.EXECUTING,
+        TaskStatus.CHECKPOINT,
+    )
+)
+TERMINAL_TASK_STATUS_VALUES = frozenset(
+    task_status_value(s)
+    for s in (
+        TaskStatus.COMPLETED,
+        TaskStatus.FAILED,
+        TaskStatus.CANCELLED,
+    )
+)
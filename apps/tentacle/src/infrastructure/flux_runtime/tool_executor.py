@@ -4,8 +4,10 @@ Handles dispatching tool calls from LLM responses and managing execution context
 """
 
 from __future__ import annotations
+from datetime import date
 from typing import Any, Dict, List, Optional
 import json
+import orjson
 import structlog
 
 from .tools.base import ToolResult
@@ -14,6 +16,13 @@ from .tool_registry import ToolRegistry, get_registry
 logger = structlog.get_logger(__name__)
 
 
+def _json_default(value: Any) -> str:
+    """Encode values JSON does not know; dates match orjson's ISO output."""
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
 class ToolCall(dict):
     """Represents a tool call from the LLM.
 
@@ -207,13 +216,23 @@ class ToolExecutor:
                 "content": "JSON string with result"
             }
         """
-        # Format the content as JSON string
-        content = json.dumps({
+        # Format the content as JSON string. orjson serializes the nested
+        # result data in one C pass; unknown types go through _json_default.
+        payload = {
             "success": result.success,
             "data": result.data,
             "error": result.error,
             "message": result.message
-        })
+        }
+        try:
+            content = orjson.dumps(
+                payload,
+                default=_json_default,
+                option=orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which json handles natively.
+            content = json.dumps(payload, default=_json_default)
 
         # OpenRouter expects: role, tool_call_id, content (no "name" field)
         return {
@@ -5,37 +5,142 @@ from Arrow chat.
 """
 
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
+import asyncio
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 import structlog
 
-from src.application.checkpoints import CheckpointUseCases
-from src.application.tasks import TaskUseCases
-from src.application.tasks.providers import (
-    get_checkpoint_use_cases as provider_get_checkpoint_use_cases,
-    get_task_use_cases as provider_get_task_use_cases,
+from src.domain.tasks.status_values import (
+    ACTIVE_TASK_STATUS_VALUES,
+    TERMINAL_TASK_STATUS_VALUES,
+    task_status_value,
 )
 from .base import BaseTool, ToolDefinition, ToolResult
 
+if TYPE_CHECKING:
+    from src.application.checkpoints import CheckpointUseCases
+    from src.application.tasks import TaskUseCases
+
 logger = structlog.get_logger(__name__)
 
+
+async def _no_checkpoints() -> List[Any]:
+    return []
+
+
+async def _list_pending_checkpoints(
+    user_id: str,
+    plan_id: Optional[str],
+    delegation_service: Any,
+    checkpoint_use_cases: Optional[CheckpointUseCases],
+) -> List[Any]:
+    """Fetch pending checkpoints, scoped to ``plan_id`` when possible.
+
+    For a single plan the task-scoped query is preferred over the
+    delegation service, which only returns all of the user's checkpoints.
+    """
+    if plan_id and checkpoint_use_cases:
+        return await checkpoint_use_cases.list_pending_for_task(plan_id)
+    if delegation_service:
+        return await delegation_service.get_pending_checkpoints(user_id)
+    if checkpoint_use_cases:
+        return await checkpoint_use_cases.list_pending(user_id)
+    return []
+
+
 _task_use_cases: Optional[TaskUseCases] = None
 _checkpoint_use_cases: Optional[CheckpointUseCases] = None
+_task_use_cases_lock = asyncio.Lock()
+_checkpoint_use_cases_lock = asyncio.Lock()
 
 
 async def _get_task_use_cases() -> TaskUseCases:
     global _task_use_cases
-    if _task_use_cases is None:
-        _task_use_cases = await provider_get_task_use_cases()
+    if _task_use_cases is not None:
+        return _task_use_cases
+    async with _task_use_cases_lock:
+        if _task_use_cases is None:
+            from src.application.tasks.providers import (
+                get_task_use_cases as provider_get_task_use_cases,
+            )
+
+            _task_use_cases = await provider_get_task_use_cases()
     return _task_use_cases
 
 
 async def _get_checkpoint_use_cases() -> CheckpointUseCases:
     global _checkpoint_use_cases
-    if _checkpoint_use_cases is None:
-        _checkpoint_use_cases = await provider_get_checkpoint_use_cases()
+    if _checkpoint_use_cases is not None:
+        return _checkpoint_use_cases
+    async with _checkpoint_use_cases_lock:
+        if _checkpoint_use_cases is None:
+            from src.application.tasks.providers import (
+                get_checkpoint_use_cases as provider_get_checkpoint_use_cases,
+            )
+
+            _checkpoint_use_cases = await provider_get_checkpoint_use_cases()
     return _checkpoint_use_cases
 
 
+def _format_plan(plan: Any, status_value: Optional[str] = None) -> Dict[str, Any]:
+    """Format a plan for display.
+
+    ``status_value`` may be passed when the caller already resolved it.
+    """
+    steps = getattr(plan, "steps", None) or []
+    step_counts = Counter(task_status_value(getattr(s, "status", None)) for s in steps)
+    total_steps = len(steps)
+    completed_steps = step_counts["done"] + step_counts["completed"]
+    if status_value is None:
+        status_value = task_status_value(getattr(plan, "status", None))
+
+    progress = 0.0
+    try:
+        progress = float(plan.get_progress_percentage())
+    except Exception:
+        if total_steps:
+            progress = round((completed_steps / total_steps) * 100, 2)
+
+    created_at = plan.created_at
+    updated_at = plan.updated_at
+    return {
+        "plan_id": plan.id,
+        "goal": plan.goal,
+        "status": status_value,
+        "progress": progress,
+        "steps_total": total_steps,
+        "steps_completed": completed_steps,
+        "steps_failed": step_counts["failed"],
+        "created_at": created_at.isoformat() if created_at else None,
+        "updated_at": updated_at.isoformat() if updated_at else None,
+    }
+
+
+def _checkpoint_plan_id(checkpoint: Any) -> Optional[str]:
+    # Only fall back to task_id when plan_id is missing; a getattr default
+    # would be evaluated eagerly on every call.
+    plan_id = getattr(checkpoint, "plan_id", None)
+    return plan_id if plan_id is not None else getattr(checkpoint, "task_id", None)
+
+
+def _format_checkpoint(checkpoint: Any, plan_id: Optional[str] = None) -> Dict[str, Any]:
+    """Format a checkpoint for display.
+
+    ``plan_id`` may be passed when the caller already resolved it.
+    """
+    created_at = checkpoint.created_at
+    expires_at = checkpoint.expires_at
+    return {
+        "plan_id": plan_id if plan_id is not None else _checkpoint_plan_id(checkpoint),
+        "step_id": checkpoint.step_id,
+        "name": checkpoint.checkpoint_name,
+        "description": checkpoint.description,
+        "preview": checkpoint.preview_data,
+        "created_at": created_at.isoformat() if created_at else None,
+        "expires_at": expires_at.isoformat() if expires_at else None,
+    }
+
+
 class GetTaskStatusTool(BaseTool):
     """Get the current status of tasks.
 
@@ -167,96 +272,77 @@ If no task_id is provided, shows all active tasks and pending checkpoints."""
                         error="Access denied to this task",
                     )
 
-                result_data = self._format_plan(plan)
+                status_value = task_status_value(getattr(plan, "status", None))
+                result_data = _format_plan(plan, status_value)
 
-                # Add checkpoint info if pending
+                # Add checkpoint info if pending. Only queried once the plan
+                # is known to exist and belong to the caller.
                 if include_checkpoints:
-                    if delegation_service:
-                        checkpoints = await delegation_service.get_pending_checkpoints(user_id)
-                    elif checkpoint_use_cases:
-                        checkpoints = await checkpoint_use_cases.list_pending_for_task(plan_id)
-                    else:
-                        checkpoints = []
+                    checkpoints = await _list_pending_checkpoints(
+                        user_id, plan_id, delegation_service, checkpoint_use_cases
+                    )
                     plan_checkpoints = [
-                        c
-                        for c in checkpoints
-                        if getattr(c, "plan_id", getattr(c, "task_id", None)) == plan_id
+                        c for c in checkpoints if _checkpoint_plan_id(c) == plan_id
                     ]
                     if plan_checkpoints:
                         result_data["pending_checkpoints"] = [
-                            self._format_checkpoint(c) for c in plan_checkpoints
+                            _format_checkpoint(c, plan_id) for c in plan_checkpoints
                         ]
 
-                status_value = self._status_value(getattr(plan, "status", None))
                 return ToolResult(
                     success=True,
                     data=result_data,
                     message=f"Task '{plan.goal[:50]}...' is {status_value}",
                 )
 
-            # List all tasks
-            from src.domain.tasks.models import TaskStatus
-
-            # Get active tasks
+            # List all tasks and pending checkpoints concurrently
             if delegation_service:
-                active_plans = await delegation_service.get_user_plans(
+                plans_fetch = delegation_service.get_user_plans(
                     user_id=user_id,
                     status=None,  # All statuses initially
                     limit=limit,
                 )
             else:
-                active_plans = await task_use_cases.list_tasks(
+                plans_fetch = task_use_cases.list_tasks(
                     user_id=user_id,
                     status=None,
                     limit=limit,
                 )
 
-            # Filter to active statuses
-            active_statuses = {
-                TaskStatus.PLANNING,
-                TaskStatus.READY,
-                TaskStatus.EXECUTING,
-                TaskStatus.CHECKPOINT,
-            }
-            active_status_values = {self._status_value(s) for s in active_statuses}
-            terminal_status_values = {
-                self._status_value(TaskStatus.COMPLETED),
-                self._status_value(TaskStatus.FAILED),
-                self._status_value(TaskStatus.CANCELLED),
-            }
+            active_plans, checkpoints = await asyncio.gather(
+                plans_fetch,
+                _list_pending_checkpoints(
+                    user_id, None, delegation_service, checkpoint_use_cases
+                )
+                if include_checkpoints
+                else _no_checkpoints(),
+            )
 
-            active_tasks = [
-                p
-                for p in active_plans
-                if self._status_value(getattr(p, "status", None)) in active_status_values
-            ]
+            # Partition into active and recently completed in a single pass,
+            # keeping each plan's status value for formatting.
+            active_tasks = []
             completed_tasks = []
-
-            if include_completed:
-                completed_tasks = [
-                    p for p in active_plans
-                    if self._status_value(getattr(p, "status", None)) in terminal_status_values
-                ][:5]  # Limit completed to 5
-
-            # Get pending checkpoints
-            pending_checkpoints = []
-            if include_checkpoints:
-                if delegation_service:
-                    checkpoints = await delegation_service.get_pending_checkpoints(user_id)
-                elif checkpoint_use_cases:
-                    checkpoints = await checkpoint_use_cases.list_pending(user_id)
-                else:
-                    checkpoints = []
-                pending_checkpoints = [self._format_checkpoint(c) for c in checkpoints]
+            for p in active_plans:
+                status_value = task_status_value(getattr(p, "status", None))
+                if status_value in ACTIVE_TASK_STATUS_VALUES:
+                    active_tasks.append((p, status_value))
+                elif (
+                    include_completed
+                    and status_value in TERMINAL_TASK_STATUS_VALUES
+                    and len(completed_tasks) < 5  # Limit completed to 5
+                ):
+                    completed_tasks.append((p, status_value))
+
+            pending_checkpoints = [_format_checkpoint(c) for c in checkpoints]
 
             result_data = {
-                "active_tasks": [self._format_plan(p) for p in active_tasks],
+                "active_tasks": [_format_plan(p, sv) for p, sv in active_tasks],
                 "active_count": len(active_tasks),
             }
 
             if include_completed:
                 result_data["completed_tasks"] = [
-                    self._format_plan(p) for p in completed_tasks
+                    _format_plan(p, sv) for p, sv in completed_tasks
                 ]
                 result_data["completed_count"] = len(completed_tasks)
 
@@ -294,50 +380,3 @@ If no task_id is provided, shows all active tasks and pending checkpoints."""
                 success=False,
                 error=f"Failed to get task status: {str(e)}",
             )
-
-    def _format_plan(self, plan) -> Dict[str, Any]:
-        """Format a plan for display."""
-        steps = getattr(plan, "steps", []) or []
-        completed_steps = sum(
-            1 for s in steps if self._status_value(getattr(s, "status", None)) in {"done", "completed"}
-        )
-        failed_steps = sum(
-            1 for s in steps if self._status_value(getattr(s, "status", None)) == "failed"
-        )
-        status_value = self._status_value(getattr(plan, "status", None))
-
-        progress = 0.0
-        try:
-            progress = float(plan.get_progress_percentage())
-        except Exception:
-            if steps:
-                progress = round((completed_steps / len(steps)) * 100, 2)
-
-        return {
-            "plan_id": plan.id,
-            "goal": plan.goal,
-            "status": status_value,
-            "progress": progress,
-            "steps_total": len(steps),
-            "steps_completed": completed_steps,
-            "steps_failed": failed_steps,
-            "created_at": plan.created_at.isoformat() if plan.created_at else None,
-            "updated_at": plan.updated_at.isoformat() if plan.updated_at else None,
-        }
-
-    def _format_checkpoint(self, checkpoint) -> Dict[str, Any]:
-        """Format a checkpoint for display."""
-        return {
-            "plan_id": getattr(checkpoint, "plan_id", getattr(checkpoint, "task_id", None)),
-            "step_id": checkpoint.step_id,
-            "name": checkpoint.checkpoint_name,
-            "description": checkpoint.description,
-            "preview": checkpoint.preview_data,
-            "created_at": checkpoint.created_at.isoformat() if checkpoint.created_at else None,
-            "expires_at": checkpoint.expires_at.isoformat() if checkpoint.expires_at else None,
-        }
-
-    @staticmethod
-    def _status_value(status: Any) -> str:
-        raw = getattr(status, "value", status)
-        return str(raw).lower() if raw is not None else "unknown"
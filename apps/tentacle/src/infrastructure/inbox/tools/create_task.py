@@ -3,44 +3,58 @@
 # REVIEW: tools thin and to centralize task creation + conversation linkage.
 """Inbox tool: Create a background task within the current conversation."""
 
+from __future__ import annotations
+
 import asyncio
+from collections import Counter
 from time import monotonic
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import structlog
 
 from src.core.config import settings
-from src.application.checkpoints import CheckpointUseCases
+from src.domain.tasks.status_values import task_status_value
 from src.infrastructure.flux_runtime.tools.base import BaseTool, ToolDefinition, ToolResult
-from src.application.tasks import TaskUseCases
-from src.application.tasks.providers import (
-    get_checkpoint_use_cases as provider_get_checkpoint_use_cases,
-    get_task_use_cases as provider_get_task_use_cases,
-)
+from src.infrastructure.tasks.event_publisher import TaskEventType
+
+if TYPE_CHECKING:
+    from src.application.checkpoints import CheckpointUseCases
+    from src.application.tasks import TaskUseCases
 
 logger = structlog.get_logger(__name__)
 
 _task_use_cases: Optional[TaskUseCases] = None
 _checkpoint_use_cases: Optional[CheckpointUseCases] = None
+_task_use_cases_lock = asyncio.Lock()
+_checkpoint_use_cases_lock = asyncio.Lock()
 
 
 async def _get_task_use_cases() -> TaskUseCases:
     global _task_use_cases
-    if _task_use_cases is None:
-        _task_use_cases = await provider_get_task_use_cases()
+    if _task_use_cases is not None:
+        return _task_use_cases
+    async with _task_use_cases_lock:
+        if _task_use_cases is None:
+            from src.application.tasks.providers import (
+                get_task_use_cases as provider_get_task_use_cases,
+            )
+
+            _task_use_cases = await provider_get_task_use_cases()
     return _task_use_cases
 
 
 async def _get_checkpoint_use_cases() -> CheckpointUseCases:
     global _checkpoint_use_cases
-    if _checkpoint_use_cases is None:
-        _checkpoint_use_cases = await provider_get_checkpoint_use_cases()
-    return _checkpoint_use_cases
-
+    if _checkpoint_use_cases is not None:
+        return _checkpoint_use_cases
+    async with _checkpoint_use_cases_lock:
+        if _checkpoint_use_cases is None:
+            from src.application.tasks.providers import (
+                get_checkpoint_use_cases as provider_get_checkpoint_use_cases,
+            )
 
-def _status_value(status: Any) -> str:
-    raw = getattr(status, "value", status)
-    return str(raw).lower() if raw is not None else "unknown"
+            _checkpoint_use_cases = await provider_get_checkpoint_use_cases()
+    return _checkpoint_use_cases
 
 
 def _safe_progress(task: Any, completed_steps: int, total_steps: int) -> float:
@@ -55,15 +69,9 @@ def _safe_progress(task: Any, completed_steps: int, total_steps: int) -> float:
 def _summarize_task(task: Any) -> Dict[str, Any]:
     steps = getattr(task, "steps", None) or []
     total_steps = len(steps)
-    completed_steps = 0
-    failed_steps = 0
-
-    for step in steps:
-        step_status = _status_value(getattr(step, "status", None))
-        if step_status in {"done", "completed"}:
-            completed_steps += 1
-        elif step_status == "failed":
-            failed_steps += 1
+    step_counts = Counter(task_status_value(getattr(step, "status", None)) for step in steps)
+    completed_steps = step_counts["done"] + step_counts["completed"]
+    failed_steps = step_counts["failed"]
 
     return {
         "steps_total": total_steps,
@@ -91,19 +99,103 @@ def _serialize_checkpoint(checkpoint: Any) -> Dict[str, Any]:
 
 
 def _resolve_wait_timeout(arguments: Dict[str, Any]) -> int:
+    timeout = settings.INBOX_CREATE_TASK_WAIT_TIMEOUT_SECONDS
     requested = arguments.get("wait_timeout_seconds")
-    default_timeout = settings.INBOX_CREATE_TASK_WAIT_TIMEOUT_SECONDS
-    max_timeout = settings.INBOX_CREATE_TASK_WAIT_MAX_TIMEOUT_SECONDS
+    if requested is not None:
+        try:
+            timeout = int(requested)
+        except (TypeError, ValueError):
+            pass
+
+    return max(0, min(timeout, settings.INBOX_CREATE_TASK_WAIT_MAX_TIMEOUT_SECONDS))
+
+
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled", "checkpoint"})
+
+# Task events that can move a task into one of the terminal statuses above.
+_STATUS_EVENT_TYPES = frozenset({
+    TaskEventType.TASK_COMPLETED.value,
+    TaskEventType.TASK_FAILED.value,
+    TaskEventType.TASK_CANCELLED.value,
+    TaskEventType.CHECKPOINT_CREATED.value,
+    TaskEventType.PLANNING_FAILED.value,
+})
+
+# Re-read the task at least this often, whatever events arrive, as a safety
+# net for transitions that are not published on the task event channel
+# (failures and cancellations are not reliably announced there).
+_IDLE_RECHECK_SECONDS = 5.0
+# Pause after an empty message that came back before the idle interval, so a
+# subscription that does not block cannot turn the wait into a busy loop.
+_EMPTY_MESSAGE_BACKOFF_SECONDS = 0.2
+
+
+class _TaskStatusReader:
+    """Reads a task's status for one wait and remembers the last snapshot.
+
+    Fetch failures are logged once per wait, with a single summary at the
+    end, so a flapping task store cannot flood the log from a wait loop.
+    """
+
+    def __init__(self, task_use_cases: TaskUseCases, task_id: str) -> None:
+        self._task_use_cases = task_use_cases
+        self._task_id = task_id
+        self.log = logger.bind(task_id=task_id)
+        self.last_task: Optional[Any] = None
+        self.last_status = "planning"
+        self.failures = 0
+
+    async def read(self) -> bool:
+        """Refresh the snapshot; return True once the task is terminal."""
+        try:
+            task = await self._task_use_cases.get_task(self._task_id)
+        except Exception as exc:
+            self.failures += 1
+            if self.failures == 1:
+                self.log.warning("Failed to fetch task status while waiting", error=str(exc))
+            return False
+        if task is None:
+            return False
+        self.last_task = task
+        self.last_status = task_status_value(getattr(task, "status", None))
+        return self.last_status in _TERMINAL_STATUSES
+
+    def result(self, timed_out: bool) -> tuple[Optional[Any], str, bool]:
+        if self.failures > 1:
+            self.log.warning(
+                "Task status fetch failed repeatedly while waiting",
+                failures=self.failures,
+            )
+        return self.last_task, self.last_status, timed_out
 
-    if requested is None:
-        return max(0, min(default_timeout, max_timeout))
 
-    try:
-        timeout_int = int(requested)
-    except (TypeError, ValueError):
-        return max(0, min(default_timeout, max_timeout))
+async def _poll_until_terminal(reader: _TaskStatusReader) -> None:
+    poll_interval = max(0.2, float(settings.INBOX_CREATE_TASK_WAIT_POLL_INTERVAL_SECONDS))
+    while True:
+        await asyncio.sleep(poll_interval)
+        if await reader.read():
+            return
 
-    return max(0, min(timeout_int, max_timeout))
+
+async def _watch_until_terminal(reader: _TaskStatusReader, subscription: Any) -> None:
+    if subscription is not None:
+        try:
+            recheck_at = monotonic() + _IDLE_RECHECK_SECONDS
+            while True:
+                event = await subscription.get_message(
+                    timeout=max(0.0, recheck_at - monotonic())
+                )
+                status_event = bool(event) and event.get("type") in _STATUS_EVENT_TYPES
+                if not status_event and monotonic() < recheck_at:
+                    if not event:
+                        await asyncio.sleep(_EMPTY_MESSAGE_BACKOFF_SECONDS)
+                    continue
+                if await reader.read():
+                    return
+                recheck_at = monotonic() + _IDLE_RECHECK_SECONDS
+        except Exception as exc:
+            reader.log.warning("Task event stream failed, polling for status", error=str(exc))
+    await _poll_until_terminal(reader)
 
 
 async def _wait_for_terminal_status(
@@ -111,34 +203,47 @@ async def _wait_for_terminal_status(
     task_id: str,
     timeout_seconds: int,
 ) -> tuple[Optional[Any], str, bool]:
-    terminal_statuses = {"completed", "failed", "cancelled", "checkpoint"}
-    poll_interval = max(0.2, float(settings.INBOX_CREATE_TASK_WAIT_POLL_INTERVAL_SECONDS))
-    deadline = monotonic() + max(0, timeout_seconds)
+    """Wait until the task reaches a terminal status or the timeout expires.
 
-    last_task: Optional[Any] = None
-    last_status = "planning"
+    Subscribes to the task event channel and re-reads the task when a
+    status-changing event arrives, and at least once per idle interval
+    regardless of other events, falling back to fixed-interval polling if
+    the event stream is unavailable.
+    """
+    deadline = monotonic() + max(0, timeout_seconds)
+    reader = _TaskStatusReader(task_use_cases, task_id)
 
-    while True:
+    subscription = None
+    if timeout_seconds > 0:
+        # Subscribe before the first read so no transition can slip in between.
         try:
-            task = await task_use_cases.get_task(task_id)
+            subscription = await task_use_cases.subscribe_events(task_id)
         except Exception as exc:
-            logger.warning(
-                "Failed to fetch task status while waiting",
-                task_id=task_id,
-                error=str(exc),
-            )
-            task = None
-        if task is not None:
-            last_task = task
-            last_status = _status_value(getattr(task, "status", None))
-            if last_status in terminal_statuses:
-                return task, last_status, False
+            reader.log.warning("Task event stream unavailable, polling for status", error=str(exc))
 
-        if monotonic() >= deadline:
-            return last_task, last_status, True
+    try:
+        if await reader.read():
+            return reader.result(timed_out=False)
 
-        remaining = deadline - monotonic()
-        await asyncio.sleep(min(poll_interval, max(0.01, remaining)))
+        try:
+            await asyncio.wait_for(
+                _watch_until_terminal(reader, subscription),
+                timeout=deadline - monotonic(),
+            )
+            return reader.result(timed_out=False)
+        except asyncio.TimeoutError:
+            pass
+
+        # One final read picks up a transition whose event arrived too late.
+        if subscription is not None and await reader.read():
+            return reader.result(timed_out=False)
+        return reader.result(timed_out=True)
+    finally:
+        if subscription is not None:
+            try:
+                await subscription.close()
+            except Exception:
+                pass
 
 
 async def _get_pending_checkpoint(task_id: str) -> Optional[Dict[str, Any]]:
@@ -204,14 +309,15 @@ class InboxCreateTaskTool(BaseTool):
         self, arguments: Dict[str, Any], context: Dict[str, Any]
     ) -> ToolResult:
         goal = arguments["goal"]
-        constraints = arguments.get("constraints") or {}
         wait_for_completion = bool(arguments.get("wait_for_completion", True))
         wait_timeout_seconds = _resolve_wait_timeout(arguments)
         user_id = context.get("user_id")
         organization_id = context.get("organization_id", "")
         conversation_id = context.get("conversation_id")
 
-        # Forward file references from chat context so the planner knows about attached files
+        # Forward file references from chat context so the planner knows about attached files.
+        # Build a new dict so the caller's arguments are never mutated.
+        constraints = dict(arguments.get("constraints") or {})
         file_references = context.get("file_references")
         if file_references:
             constraints["file_references"] = file_references
@@ -34,7 +34,7 @@ class TaskExecutionEventSubscriptionAdapter(TaskExecutionEventSubscription):
 
         try:
             message = await asyncio.wait_for(
-                self._pubsub.get_message(ignore_subscribe_messages=True),
+                self._pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout),
                 timeout=timeout,
             )
         except asyncio.TimeoutError:
@@ -3,12 +3,14 @@ from contextlib import asynccontextmanager
 import structlog
 from redis import asyncio as aioredis
 from src.core.config import settings
+from src.core.logging_config import configure_logging
 from src.interfaces.database import Database
 from src.mcp.registry import MCPRegistry
 from src.agents.registry import register_default_agents
 from src.api.cors_config import configure_cors
 from src.integrations.posthog_client import posthog_client
 
+configure_logging()
 logger = structlog.get_logger()
 
 
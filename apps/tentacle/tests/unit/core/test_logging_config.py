@@ -0,0 +1,40 @@
+"""Unit tests for the structlog JSON configuration."""
+import io
+import json
+
+import pytest
+import structlog
+
+from src.core import logging_config
+
+
+@pytest.fixture
+def json_log_output(monkeypatch):
+    """Configure JSON logging into an in-memory stdout and restore afterwards."""
+    previous = structlog.get_config()
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    monkeypatch.setattr(logging_config.settings, "DEBUG", False)
+    monkeypatch.setattr(logging_config.sys, "stdout", stdout)
+    logging_config.configure_logging()
+    try:
+        yield stdout.buffer
+    finally:
+        structlog.configure(**previous)
+
+
+def _last_line(buffer: io.BytesIO) -> dict:
+    return json.loads(buffer.getvalue().splitlines()[-1])
+
+
+def test_logs_non_str_keys(json_log_output):
+    structlog.get_logger("test").warning("counts", counts={1: 2})
+
+    assert _last_line(json_log_output)["counts"] == {"1": 2}
+
+
+def test_logs_integers_beyond_64_bits(json_log_output):
+    structlog.get_logger("test").warning("big", n=2**70)
+
+    line = _last_line(json_log_output)
+    assert line["event"] == "big"
+    assert line["n"] == 2**70
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Any, Dict
+
+from src.infrastructure.flux_runtime.tool_executor import ToolExecutor
+from src.infrastructure.flux_runtime.tool_registry import ToolRegistry
+from src.infrastructure.flux_runtime.tools.base import ToolResult
+
+
+def _content(result: ToolResult) -> Dict[str, Any]:
+    response = ToolExecutor(registry=ToolRegistry())._format_tool_response(
+        "call-1", "some_tool", result
+    )
+    assert response["role"] == "tool"
+    assert response["tool_call_id"] == "call-1"
+    return json.loads(response["content"])
+
+
+def test_format_tool_response_stringifies_unknown_types_and_keys() -> None:
+    content = _content(
+        ToolResult(success=True, data={1: datetime(2024, 1, 1), "obj": object()})
+    )
+
+    assert content["success"] is True
+    assert content["data"]["1"] == "2024-01-01T00:00:00"
+    assert content["data"]["obj"].startswith("<object object")
+
+
+def test_format_tool_response_handles_integers_beyond_64_bits() -> None:
+    content = _content(
+        ToolResult(success=True, data={"big": 2**70, "at": datetime(2024, 1, 1)})
+    )
+
+    assert content["data"]["big"] == 2**70
+    # The json fallback renders datetimes the same way as orjson.
+    assert content["data"]["at"] == "2024-01-01T00:00:00"
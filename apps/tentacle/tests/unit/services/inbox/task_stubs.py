@@ -0,0 +1,13 @@
+"""Shared stub data for the inbox task tool tests."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from src.domain.tasks.models import StepStatus
+
+FIXED_NOW = datetime(2024, 1, 1)
+FIXED_EXPIRES = FIXED_NOW + timedelta(minutes=30)
+# Tests only read ``step.status``, so one stub per status can be shared.
+STEP_NS = {s: SimpleNamespace(status=s) for s in StepStatus}
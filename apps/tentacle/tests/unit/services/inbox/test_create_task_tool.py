@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import asyncio
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.domain.checkpoints import CheckpointDecision, CheckpointState, CheckpointType
 from src.domain.tasks.models import StepStatus, TaskStatus
+from src.infrastructure.inbox.tools import create_task as create_task_module
 from src.infrastructure.inbox.tools.create_task import InboxCreateTaskTool
+from tests.unit.services.inbox.task_stubs import FIXED_EXPIRES, FIXED_NOW, STEP_NS
 
 
 @pytest.fixture
@@ -27,11 +29,18 @@ def valid_context() -> dict:
     }
 
 
+@pytest.fixture
+def mock_task_use_cases() -> AsyncMock:
+    use_cases = AsyncMock()
+    use_cases.create_task.return_value = SimpleNamespace(id="task-123")
+    return use_cases
+
+
 def _task_snapshot(status: TaskStatus, steps: list[StepStatus] | None = None) -> SimpleNamespace:
     return SimpleNamespace(
         id="task-123",
         status=status,
-        steps=[SimpleNamespace(status=s) for s in (steps or [])],
+        steps=[STEP_NS[s] for s in (steps or [])],
         user_id="user-123",
     )
 
@@ -45,6 +54,44 @@ class TestToolDefinition:
         assert "wait_timeout_seconds" in props
         assert props["wait_for_completion"]["default"] is True
 
+    def test_definition_reads_max_wait_timeout_per_call(
+        self, tool: InboxCreateTaskTool, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(
+            create_task_module.settings, "INBOX_CREATE_TASK_WAIT_MAX_TIMEOUT_SECONDS", 7
+        )
+        props = tool.get_definition().parameters["properties"]
+
+        assert props["wait_timeout_seconds"]["maximum"] == 7
+
+    def test_definition_mutation_does_not_leak(self, tool: InboxCreateTaskTool) -> None:
+        tool.get_definition().parameters["properties"].pop("goal")
+
+        assert "goal" in tool.get_definition().parameters["properties"]
+
+
+class TestUseCaseProviders:
+    @pytest.mark.asyncio
+    async def test_concurrent_first_calls_construct_use_cases_once(
+        self, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        sentinel = object()
+
+        async def slow_provider():
+            await asyncio.sleep(0)
+            return sentinel
+
+        provider = AsyncMock(side_effect=slow_provider)
+        monkeypatch.setattr(create_task_module, "_task_use_cases", None)
+
+        with patch("src.application.tasks.providers.get_task_use_cases", new=provider):
+            results = await asyncio.gather(
+                *(create_task_module._get_task_use_cases() for _ in range(5))
+            )
+
+        assert all(result is sentinel for result in results)
+        provider.assert_awaited_once()
+
 
 class TestExecute:
     @pytest.mark.asyncio
@@ -55,11 +102,8 @@ class TestExecute:
 
     @pytest.mark.asyncio
     async def test_wait_returns_terminal_completion(
-        self, tool: InboxCreateTaskTool, valid_context: dict,
+        self, tool: InboxCreateTaskTool, valid_context: dict, mock_task_use_cases: AsyncMock,
     ) -> None:
-        mock_task_use_cases = AsyncMock()
-        mock_task_use_cases.create_task = AsyncMock(return_value=SimpleNamespace(id="task-123"))
-        mock_task_use_cases.link_conversation = AsyncMock()
         mock_task_use_cases.get_task = AsyncMock(
             return_value=_task_snapshot(
                 status=TaskStatus.COMPLETED,
@@ -92,11 +136,8 @@ class TestExecute:
 
     @pytest.mark.asyncio
     async def test_wait_timeout_returns_running(
-        self, tool: InboxCreateTaskTool, valid_context: dict,
+        self, tool: InboxCreateTaskTool, valid_context: dict, mock_task_use_cases: AsyncMock,
     ) -> None:
-        mock_task_use_cases = AsyncMock()
-        mock_task_use_cases.create_task = AsyncMock(return_value=SimpleNamespace(id="task-123"))
-        mock_task_use_cases.link_conversation = AsyncMock()
         mock_task_use_cases.get_task = AsyncMock(
             return_value=_task_snapshot(
                 status=TaskStatus.PLANNING,
@@ -124,11 +165,8 @@ class TestExecute:
 
     @pytest.mark.asyncio
     async def test_checkpoint_status_includes_pending_checkpoint_data(
-        self, tool: InboxCreateTaskTool, valid_context: dict,
+        self, tool: InboxCreateTaskTool, valid_context: dict, mock_task_use_cases: AsyncMock,
     ) -> None:
-        mock_task_use_cases = AsyncMock()
-        mock_task_use_cases.create_task = AsyncMock(return_value=SimpleNamespace(id="task-123"))
-        mock_task_use_cases.link_conversation = AsyncMock()
         mock_task_use_cases.get_task = AsyncMock(
             return_value=_task_snapshot(
                 status=TaskStatus.CHECKPOINT,
@@ -143,8 +181,8 @@ class TestExecute:
             description="Need approval",
             decision=CheckpointDecision.PENDING,
             preview_data={"risk": "high"},
-            created_at=datetime.utcnow(),
-            expires_at=datetime.utcnow() + timedelta(minutes=30),
+            created_at=FIXED_NOW,
+            expires_at=FIXED_EXPIRES,
             checkpoint_type=CheckpointType.APPROVAL,
         )
         mock_checkpoint_use_cases = AsyncMock()
@@ -173,11 +211,8 @@ class TestExecute:
 
     @pytest.mark.asyncio
     async def test_wait_disabled_returns_planning_without_polling(
-        self, tool: InboxCreateTaskTool, valid_context: dict,
+        self, tool: InboxCreateTaskTool, valid_context: dict, mock_task_use_cases: AsyncMock,
     ) -> None:
-        mock_task_use_cases = AsyncMock()
-        mock_task_use_cases.create_task = AsyncMock(return_value=SimpleNamespace(id="task-123"))
-        mock_task_use_cases.link_conversation = AsyncMock()
         mock_task_use_cases.get_task = AsyncMock()
 
         with patch(
@@ -195,3 +230,218 @@ class TestExecute:
         assert result.success is True
         assert result.data["status"] == "planning"
         mock_task_use_cases.get_task.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_wait_refetches_task_on_status_event(
+        self, tool: InboxCreateTaskTool, valid_context: dict, mock_task_use_cases: AsyncMock,
+    ) -> None:
+        subscription = AsyncMock()
+        subscription.get_message = AsyncMock(
+            side_effect=[
+                {"type": "task.step.started"},
+                {"type": "task.completed"},
+            ]
+        )
+        mock_task_use_cases.subscribe_events = AsyncMock(return_value=subscription)
+        mock_task_use_cases.get_task = AsyncMock(
+            side_effect=[
+                _task_snapshot(status=TaskStatus.EXECUTING, steps=[StepStatus.RUNNING]),
+                _task_snapshot(status=TaskStatus.COMPLETED, steps=[StepStatus.DONE]),
+            ]
+        )
+
+        with patch(
+            "src.infrastructure.inbox.tools.create_task._get_task_use_cases",
+            new=AsyncMock(return_value=mock_task_use_cases),
+        ):
+            result = await tool.execute(
+                {
+                    "goal": "Research agent patterns",
+                    "wait_for_completion": True,
+                    "wait_timeout_seconds": 5,
+                },
+                valid_context,
+            )
+
+        assert result.success is True
+        assert result.data["status"] == "completed"
+        assert mock_task_use_cases.get_task.await_count == 2
+        subscription.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_wait_does_not_spin_on_non_blocking_subscription(
+        self, tool: InboxCreateTaskTool, valid_context: dict, mock_task_use_cases: AsyncMock,
+    ) -> None:
+        class _NonBlockingSubscription:
+            def __init__(self) -> None:
+                self.closed = False
+
+            async def get_message(self, timeout: float = 1.0) -> None:
+                return None
+
+            async def close(self) -> None:
+                self.closed = True
+
+        subscription = _NonBlockingSubscription()
+        mock_task_use_cases.subscribe_events = AsyncMock(return_value=subscription)
+        mock_task_use_cases.get_task = AsyncMock(
+            return_value=_task_snapshot(status=TaskStatus.PLANNING)
+        )
+
+        with patch(
+            "src.infrastructure.inbox.tools.create_task._get_task_use_cases",
+            new=AsyncMock(return_value=mock_task_use_cases),
+        ), patch.object(create_task_module, "_IDLE_RECHECK_SECONDS", 0.4):
+            result = await tool.execute(
+                {
+                    "goal": "Research agent patterns",
+                    "wait_for_completion": True,
+                    "wait_timeout_seconds": 1,
+                },
+                valid_context,
+            )
+
+        assert result.data["timed_out"] is True
+        # Initial read, a couple of idle rechecks and the final read; an
+        # unthrottled loop would re-read the task thousands of times.
+        assert mock_task_use_cases.get_task.await_count <= 5
+        assert subscription.closed is True
+
+    @pytest.mark.asyncio
+    async def test_wait_rechecks_status_while_step_events_keep_arriving(
+        self, tool: InboxCreateTaskTool, valid_context: dict, mock_task_use_cases: AsyncMock,
+    ) -> None:
+        class _StepEventSubscription:
+            async def get_message(self, timeout: float = 1.0) -> dict:
+                await asyncio.sleep(0.01)
+                return {"type": "task.step.completed"}
+
+            async def close(self) -> None:
+                pass
+
+        mock_task_use_cases.subscribe_events = AsyncMock(return_value=_StepEventSubscription())
+        # No task.failed event is ever published; only the periodic re-read
+        # can observe the failure before the wait times out.
+        mock_task_use_cases.get_task = AsyncMock(
+            side_effect=[
+                _task_snapshot(status=TaskStatus.EXECUTING, steps=[StepStatus.RUNNING]),
+                _task_snapshot(status=TaskStatus.EXECUTING, steps=[StepStatus.RUNNING]),
+                _task_snapshot(status=TaskStatus.FAILED, steps=[StepStatus.FAILED]),
+            ]
+        )
+
+        with patch(
+            "src.infrastructure.inbox.tools.create_task._get_task_use_cases",
+            new=AsyncMock(return_value=mock_task_use_cases),
+        ), patch.object(create_task_module, "_IDLE_RECHECK_SECONDS", 0.2):
+            result = await tool.execute(
+                {
+                    "goal": "Research agent patterns",
+                    "wait_for_completion": True,
+                    "wait_timeout_seconds": 2,
+                },
+                valid_context,
+            )
+
+        assert result.data["timed_out"] is False
+        assert result.data["status"] == "failed"
+        assert mock_task_use_cases.get_task.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_wait_falls_back_to_polling_without_event_stream(
+        self, tool: InboxCreateTaskTool, valid_context: dict, mock_task_use_cases: AsyncMock,
+    ) -> None:
+        mock_task_use_cases.subscribe_events = AsyncMock(side_effect=ConnectionError("redis down"))
+        mock_task_use_cases.get_task = AsyncMock(
+            side_effect=[
+                _task_snapshot(status=TaskStatus.PLANNING),
+                _task_snapshot(status=TaskStatus.FAILED),
+            ]
+        )
+
+        with patch(
+            "src.infrastructure.inbox.tools.create_task._get_task_use_cases",
+            new=AsyncMock(return_value=mock_task_use_cases),
+        ), patch(
+            "src.infrastructure.inbox.tools.create_task.asyncio.sleep",
+            new=AsyncMock(),
+        ):
+            result = await tool.execute(
+                {
+                    "goal": "Research agent patterns",
+                    "wait_for_completion": True,
+                    "wait_timeout_seconds": 5,
+                },
+                valid_context,
+            )
+
+        assert result.success is True
+        assert result.data["status"] == "failed"
+        assert mock_task_use_cases.get_task.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_wait_logs_repeated_fetch_failures_once(
+        self, tool: InboxCreateTaskTool, valid_context: dict, mock_task_use_cases: AsyncMock,
+    ) -> None:
+        mock_task_use_cases.subscribe_events = AsyncMock(side_effect=ConnectionError("redis down"))
+        mock_task_use_cases.get_task = AsyncMock(
+            side_effect=[
+                ConnectionError("store down"),
+                ConnectionError("store down"),
+                ConnectionError("store down"),
+                _task_snapshot(status=TaskStatus.COMPLETED),
+            ]
+        )
+        mock_logger = MagicMock()
+
+        with patch(
+            "src.infrastructure.inbox.tools.create_task._get_task_use_cases",
+            new=AsyncMock(return_value=mock_task_use_cases),
+        ), patch(
+            "src.infrastructure.inbox.tools.create_task.asyncio.sleep",
+            new=AsyncMock(),
+        ), patch(
+            "src.infrastructure.inbox.tools.create_task.logger",
+            new=mock_logger,
+        ):
+            result = await tool.execute(
+                {
+                    "goal": "Research agent patterns",
+                    "wait_for_completion": True,
+                    "wait_timeout_seconds": 5,
+                },
+                valid_context,
+            )
+
+        assert result.data["status"] == "completed"
+        warnings = [c.args[0] for c in mock_logger.bind.return_value.warning.call_args_list]
+        assert warnings == [
+            "Task event stream unavailable, polling for status",
+            "Failed to fetch task status while waiting",
+            "Task status fetch failed repeatedly while waiting",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_file_references_do_not_mutate_caller_constraints(
+        self, tool: InboxCreateTaskTool, valid_context: dict, mock_task_use_cases: AsyncMock,
+    ) -> None:
+        constraints = {"budget": 5}
+        file_references = [{"file_id": "file-1"}]
+
+        with patch(
+            "src.infrastructure.inbox.tools.create_task._get_task_use_cases",
+            new=AsyncMock(return_value=mock_task_use_cases),
+        ):
+            result = await tool.execute(
+                {
+                    "goal": "Summarize the attachment",
+                    "constraints": constraints,
+                    "wait_for_completion": False,
+                },
+                {**valid_context, "file_references": file_references},
+            )
+
+        assert result.success is True
+        assert constraints == {"budget": 5}
+        sent = mock_task_use_cases.create_task.await_args.kwargs["constraints"]
+        assert sent == {"budget": 5, "file_references": file_references}
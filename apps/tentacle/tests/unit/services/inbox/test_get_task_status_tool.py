@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
 
 from src.domain.tasks.models import StepStatus, TaskStatus
+from src.domain.tasks.status_values import task_status_value
 from src.infrastructure.flux_runtime.tools.get_task_status import GetTaskStatusTool
+from tests.unit.services.inbox.task_stubs import FIXED_EXPIRES, FIXED_NOW, STEP_NS
 
 
 def _task(task_id: str, user_id: str, status: TaskStatus, steps: list[StepStatus]) -> SimpleNamespace:
@@ -18,9 +19,9 @@ def _task(task_id: str, user_id: str, status: TaskStatus, steps: list[StepStatus
         user_id=user_id,
         goal=f"Goal for {task_id}",
         status=status,
-        steps=[SimpleNamespace(status=s) for s in steps],
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
+        steps=[STEP_NS[s] for s in steps],
+        created_at=FIXED_NOW,
+        updated_at=FIXED_NOW,
         get_progress_percentage=lambda: 50.0,
     )
 
@@ -32,8 +33,8 @@ def _checkpoint(task_id: str) -> SimpleNamespace:
         checkpoint_name="approval",
         description="Review required",
         preview_data={"risk": "high"},
-        created_at=datetime.utcnow(),
-        expires_at=datetime.utcnow() + timedelta(minutes=30),
+        created_at=FIXED_NOW,
+        expires_at=FIXED_EXPIRES,
     )
 
 
@@ -42,10 +43,20 @@ def tool() -> GetTaskStatusTool:
     return GetTaskStatusTool()
 
 
+@pytest.fixture
+def task_use_cases() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def checkpoint_use_cases() -> AsyncMock:
+    return AsyncMock()
+
+
 @pytest.mark.asyncio
-async def test_specific_task_uses_inbox_fallback_context(tool: GetTaskStatusTool) -> None:
-    task_use_cases = AsyncMock()
-    checkpoint_use_cases = AsyncMock()
+async def test_specific_task_uses_inbox_fallback_context(
+    tool: GetTaskStatusTool, task_use_cases: AsyncMock, checkpoint_use_cases: AsyncMock,
+) -> None:
     task_use_cases.get_task = AsyncMock(
         return_value=_task("task-1", "user-1", TaskStatus.PLANNING, [StepStatus.PENDING])
     )
@@ -67,9 +78,9 @@ async def test_specific_task_uses_inbox_fallback_context(tool: GetTaskStatusTool
 
 
 @pytest.mark.asyncio
-async def test_list_tasks_uses_inbox_fallback_context(tool: GetTaskStatusTool) -> None:
-    task_use_cases = AsyncMock()
-    checkpoint_use_cases = AsyncMock()
+async def test_list_tasks_uses_inbox_fallback_context(
+    tool: GetTaskStatusTool, task_use_cases: AsyncMock, checkpoint_use_cases: AsyncMock,
+) -> None:
     task_use_cases.list_tasks = AsyncMock(
         return_value=[
             _task("task-active", "user-1", TaskStatus.PLANNING, [StepStatus.PENDING]),
@@ -95,3 +106,86 @@ async def test_list_tasks_uses_inbox_fallback_context(tool: GetTaskStatusTool) -
     assert result.data["active_count"] == 1
     assert result.data["completed_count"] == 1
     assert result.data["checkpoint_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_specific_task_denies_other_users_task(
+    tool: GetTaskStatusTool, task_use_cases: AsyncMock, checkpoint_use_cases: AsyncMock,
+) -> None:
+    task_use_cases.get_task = AsyncMock(
+        return_value=_task("task-1", "user-2", TaskStatus.PLANNING, [StepStatus.PENDING])
+    )
+    checkpoint_use_cases.list_pending_for_task = AsyncMock(return_value=[_checkpoint("task-1")])
+
+    result = await tool.execute(
+        {"plan_id": "task-1", "include_checkpoints": True},
+        {
+            "user_id": "user-1",
+            "task_use_cases": task_use_cases,
+            "checkpoint_use_cases": checkpoint_use_cases,
+        },
+    )
+
+    assert result.success is False
+    assert result.error == "Access denied to this task"
+    assert result.data is None
+    checkpoint_use_cases.list_pending_for_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_specific_task_not_found_ignores_checkpoint_failures(
+    tool: GetTaskStatusTool, task_use_cases: AsyncMock, checkpoint_use_cases: AsyncMock,
+) -> None:
+    task_use_cases.get_task = AsyncMock(return_value=None)
+    checkpoint_use_cases.list_pending_for_task = AsyncMock(side_effect=ConnectionError("db down"))
+
+    result = await tool.execute(
+        {"plan_id": "task-1", "include_checkpoints": True},
+        {
+            "user_id": "user-1",
+            "task_use_cases": task_use_cases,
+            "checkpoint_use_cases": checkpoint_use_cases,
+        },
+    )
+
+    assert result.success is False
+    assert result.error == "Task not found: task-1"
+
+
+@pytest.mark.asyncio
+async def test_specific_task_prefers_task_scoped_checkpoint_query(
+    tool: GetTaskStatusTool, checkpoint_use_cases: AsyncMock,
+) -> None:
+    delegation_service = AsyncMock()
+    delegation_service.get_plan = AsyncMock(
+        return_value=_task("task-1", "user-1", TaskStatus.CHECKPOINT, [StepStatus.CHECKPOINT])
+    )
+    checkpoint_use_cases.list_pending_for_task = AsyncMock(return_value=[_checkpoint("task-1")])
+
+    result = await tool.execute(
+        {"plan_id": "task-1", "include_checkpoints": True},
+        {
+            "user_id": "user-1",
+            "delegation_service": delegation_service,
+            "checkpoint_use_cases": checkpoint_use_cases,
+        },
+    )
+
+    assert result.success is True
+    assert result.data["pending_checkpoints"][0]["plan_id"] == "task-1"
+    checkpoint_use_cases.list_pending_for_task.assert_awaited_once_with("task-1")
+    delegation_service.get_pending_checkpoints.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("status", "expected"),
+    [
+        (TaskStatus.COMPLETED, "completed"),
+        ("EXECUTING", "executing"),
+        (None, "unknown"),
+        (SimpleNamespace(value=None), "unknown"),
+        ({"state": "odd"}, "{'state': 'odd'}"),
+    ],
+)
+def test_task_status_value_normalizes_any_status(status, expected) -> None:
+    assert task_status_value(status) == expected
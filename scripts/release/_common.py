@@ -1,10 +1,17 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import fnmatch
 import json
 import hashlib
+import mmap
+import os
 import re
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +20,16 @@ try:
 except ModuleNotFoundError:  # pragma: no cover
     import tomli as tomllib  # type: ignore[no-redef]
 
+try:
+    import rtoml  # optional Rust-backed TOML parser
+except ModuleNotFoundError:  # pragma: no cover
+    rtoml = None
+
+try:
+    import orjson  # optional, faster JSON with identical 2-space output
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None
+
 try:
     import yaml
 except ModuleNotFoundError as exc:  # pragma: no cover
@@ -20,12 +37,30 @@ except ModuleNotFoundError as exc:  # pragma: no cover
         "PyYAML is required. Install with: python3 -m pip install pyyaml"
     ) from exc
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 SEMVER_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
 VERSION_ASSIGN_RE = re.compile(r'(__version__\s*=\s*["\'])([^"\']+)(["\'])')
 SETUP_VERSION_RE = re.compile(r'(version\s*=\s*["\'])([^"\']+)(["\'])')
+VERSION_ASSIGN_BYTES_RE = re.compile(VERSION_ASSIGN_RE.pattern.encode("ascii"))
+SETUP_VERSION_BYTES_RE = re.compile(SETUP_VERSION_RE.pattern.encode("ascii"))
+PYPROJECT_VERSION_LINE_RE = re.compile(rb'^([ \t]*)version[ \t]*=[ \t]*"[^"]+"[ \t]*(?=\r?\n|\Z)', re.MULTILINE)
+TOML_TABLE_HEADER_RE = re.compile(rb"^[ \t]*(\[[^\r\n]*\])[ \t]*\r?$", re.MULTILINE)
 VALID_BUMPS = {"patch", "minor", "major"}
 
 
+class VersionDriftError(ValueError):
+    def __init__(self, expected: str, found: str) -> None:
+        super().__init__(f"expected {expected}, found {found}")
+        self.expected = expected
+        self.found = found
+
+
 @dataclass
 class VersionInfo:
     current: str
@@ -34,32 +69,44 @@ class VersionInfo:
 
 def load_yaml(path: Path) -> Any:
     with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def dump_yaml(path: Path, data: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, sort_keys=False)
+        yaml.dump(data, f, Dumper=_YamlDumper, sort_keys=False)
+
+
+def _json_loads(content: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, indent=2) + "\n").encode("utf-8")
 
 
 def load_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return _json_loads(path.read_bytes())
 
 
 def dump_json(path: Path, data: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    path.write_bytes(_json_dumps(data))
 
 
 def ensure_semver(version: str) -> tuple[int, int, int]:
-    m = SEMVER_RE.match(version.strip())
-    if not m:
+    # Equivalent to SEMVER_RE.match() on the stripped value, without the
+    # regex engine: exactly three all-digit components.
+    parts = version.strip().split(".", 3)
+    if len(parts) != 3 or not all(part.isdecimal() for part in parts):
         raise ValueError(f"Invalid semver: {version}")
-    return int(m.group(1)), int(m.group(2)), int(m.group(3))
+    major, minor, patch = parts
+    return int(major), int(minor), int(patch)
 
 
 def bump_semver(version: str, bump: str) -> str:
@@ -86,79 +133,151 @@ def ensure_valid_bump(bump: str) -> str:
     return bump
 
 
-def read_pyproject_version(path: Path) -> str:
-    data = tomllib.loads(path.read_text(encoding="utf-8"))
+@contextmanager
+def _mapped_file(path: Path) -> Iterator[bytes | mmap.mmap]:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            # mmap refuses zero-length mappings.
+            yield b""
+            return
+        with mmap.mmap(fd, size, prot=mmap.PROT_READ) as mapped:
+            yield mapped
+    finally:
+        os.close(fd)
+
+
+def _parse_pyproject_version(content: str) -> str:
+    data = rtoml.loads(content) if rtoml is not None else tomllib.loads(content)
     return data["project"]["version"]
 
 
-def write_pyproject_version(path: Path, new_version: str) -> None:
-    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
-    in_project = False
-    changed = False
-
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if stripped.startswith("[") and stripped.endswith("]"):
-            in_project = stripped == "[project]"
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    # Write a sibling temp file and rename it over the target so an
+    # interrupted release step never leaves a truncated file behind. Symlinks
+    # are resolved first so the rename updates the real file, not the link.
+    target = Path(os.path.realpath(path))
+    tmp_path = target.with_suffix(target.suffix + ".tmp")
+    try:
+        mode: int | None = os.stat(target).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if mode is not None:
+                # The mode given to os.open() is masked by the umask.
+                os.fchmod(f.fileno(), mode)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def read_pyproject_version(path: Path) -> str:
+    return _parse_pyproject_version(path.read_text(encoding="utf-8"))
+
+
+def _replace_pyproject_version(content: bytes, path: Path, new_version: str) -> bytes:
+    # Splice the new version into the [project] table in place rather than
+    # splitting and re-joining every line of the file.
+    headers = list(TOML_TABLE_HEADER_RE.finditer(content))
+    for i, header in enumerate(headers):
+        if header.group(1) != b"[project]":
             continue
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(content)
+        m = PYPROJECT_VERSION_LINE_RE.search(content, header.end(), end)
+        if m:
+            new_line = m.group(1) + b'version = "' + new_version.encode("utf-8") + b'"'
+            return content[: m.start()] + new_line + content[m.end() :]
 
-        if in_project and re.match(r'^version\s*=\s*"[^"]+"\s*$', stripped):
-            indent = line[: len(line) - len(line.lstrip())]
-            newline = "\n" if line.endswith("\n") else ""
-            lines[i] = f'{indent}version = "{new_version}"{newline}'
-            changed = True
-            break
+    raise ValueError(f"Could not update [project].version in {path}")
 
-    if not changed:
-        raise ValueError(f"Could not update [project].version in {path}")
 
-    path.write_text("".join(lines), encoding="utf-8")
+def _swap_pyproject_version(content: bytes, path: Path, new_version: str) -> tuple[str, bytes]:
+    current = _parse_pyproject_version(content.decode("utf-8"))
+    return current, _replace_pyproject_version(content, path, new_version)
+
+
+def write_pyproject_version(path: Path, new_version: str) -> None:
+    atomic_write_bytes(path, _replace_pyproject_version(path.read_bytes(), path, new_version))
+
+
+def _version_replacement(new_version: str) -> bytes:
+    return b"\\g<1>" + new_version.encode("utf-8") + b"\\g<3>"
 
 
 def read_setup_py_version(path: Path) -> str:
-    content = path.read_text(encoding="utf-8")
-    m = SETUP_VERSION_RE.search(content)
+    with _mapped_file(path) as content:
+        m = SETUP_VERSION_BYTES_RE.search(content)
+        if not m:
+            raise ValueError(f"Could not find version= in {path}")
+        return m.group(2).decode("utf-8")
+
+
+def _swap_setup_py_version(content: bytes, path: Path, new_version: str) -> tuple[str, bytes]:
+    m = SETUP_VERSION_BYTES_RE.search(content)
     if not m:
-        raise ValueError(f"Could not find version= in {path}")
-    return m.group(2)
+        raise ValueError(f"Could not update setup.py version in {path}")
+    updated = content[: m.start(2)] + new_version.encode("utf-8") + content[m.end(2) :]
+    return m.group(2).decode("utf-8"), updated
 
 
 def write_setup_py_version(path: Path, new_version: str) -> None:
-    content = path.read_text(encoding="utf-8")
-    updated, count = SETUP_VERSION_RE.subn(rf"\g<1>{new_version}\g<3>", content, count=1)
-    if count != 1:
-        raise ValueError(f"Could not update setup.py version in {path}")
-    path.write_text(updated, encoding="utf-8")
+    atomic_write_bytes(path, _swap_setup_py_version(path.read_bytes(), path, new_version)[1])
 
 
 def read_package_json_version(path: Path) -> str:
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data["version"]
+    return _json_loads(path.read_bytes())["version"]
 
 
-def write_package_json_version(path: Path, new_version: str) -> None:
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+def _swap_package_json_version(content: bytes, path: Path, new_version: str) -> tuple[str, bytes]:
+    data = _json_loads(content)
+    current = data["version"]
     data["version"] = new_version
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    return current, _json_dumps(data)
+
+
+def write_package_json_version(path: Path, new_version: str) -> None:
+    atomic_write_bytes(path, _swap_package_json_version(path.read_bytes(), path, new_version)[1])
 
 
 def read_plain_version(path: Path) -> str:
     return path.read_text(encoding="utf-8").strip()
 
 
+def _swap_plain_version(content: bytes, path: Path, new_version: str) -> tuple[str, bytes]:
+    return content.decode("utf-8").strip(), f"{new_version}\n".encode("utf-8")
+
+
 def write_plain_version(path: Path, new_version: str) -> None:
-    path.write_text(f"{new_version}\n", encoding="utf-8")
+    atomic_write_bytes(path, f"{new_version}\n".encode("utf-8"))
+
+
+_VERSION_SWAPPERS = {
+    "pyproject": _swap_pyproject_version,
+    "setup-py": _swap_setup_py_version,
+    "package-json": _swap_package_json_version,
+    "plain": _swap_plain_version,
+}
 
 
 def read_component_version(repo_root: Path, component: dict[str, Any]) -> str:
     version_meta = component["version"]
     version_file = repo_root / version_meta["file"]
-    kind = version_meta["kind"]
+    # Components may share a version file; key the parse on the file's
+    # identity so a rewrite (always a new inode, see atomic_write_bytes) or
+    # an in-place edit is never served from the cache.
+    st = os.stat(version_file)
+    return _read_version_file(version_meta["kind"], version_file, st.st_ino, st.st_mtime_ns, st.st_size)
 
+
+@lru_cache(maxsize=256)
+def _read_version_file(kind: str, version_file: Path, ino: int, mtime_ns: int, size: int) -> str:
     if kind == "pyproject":
         return read_pyproject_version(version_file)
     if kind == "setup-py":
@@ -187,25 +306,57 @@ def write_component_version(repo_root: Path, component: dict[str, Any], new_vers
         raise ValueError(f"Unsupported version kind: {kind}")
 
     changed_files = [str(version_meta["file"])]
+    changed_files.extend(_write_runtime_versions(repo_root, component, new_version))
+    _read_version_file.cache_clear()
+    return changed_files
+
+
+def rewrite_component_version(
+    repo_root: Path,
+    component: dict[str, Any],
+    expected_current: str,
+    new_version: str,
+) -> list[str]:
+    version_meta = component["version"]
+    version_file = repo_root / version_meta["file"]
+    kind = version_meta["kind"]
+
+    swap = _VERSION_SWAPPERS.get(kind)
+    if swap is None:
+        raise ValueError(f"Unsupported version kind: {kind}")
 
+    # Parse the current version from the same bytes that get rewritten, so
+    # each version file is read exactly once.
+    current, updated = swap(version_file.read_bytes(), version_file, new_version)
+    if current != expected_current:
+        raise VersionDriftError(expected_current, current)
+    atomic_write_bytes(version_file, updated)
+
+    changed_files = [str(version_meta["file"])]
+    changed_files.extend(_write_runtime_versions(repo_root, component, new_version))
+    _read_version_file.cache_clear()
+    return changed_files
+
+
+def _write_runtime_versions(repo_root: Path, component: dict[str, Any], new_version: str) -> list[str]:
+    changed_files: list[str] = []
     for runtime_file in component.get("runtime_version_files", []):
         runtime_path = repo_root / runtime_file
-        content = runtime_path.read_text(encoding="utf-8")
-        updated, count = VERSION_ASSIGN_RE.subn(rf"\g<1>{new_version}\g<3>", content, count=1)
+        content = runtime_path.read_bytes()
+        updated, count = VERSION_ASSIGN_BYTES_RE.subn(_version_replacement(new_version), content, count=1)
         if count != 1:
             raise ValueError(f"Could not update __version__ in {runtime_file}")
-        runtime_path.write_text(updated, encoding="utf-8")
+        atomic_write_bytes(runtime_path, updated)
         changed_files.append(runtime_file)
-
     return changed_files
 
 
 def read_runtime_file_version(path: Path) -> str:
-    content = path.read_text(encoding="utf-8")
-    m = VERSION_ASSIGN_RE.search(content)
-    if not m:
-        raise ValueError(f"Could not find __version__ assignment in {path}")
-    return m.group(2)
+    with _mapped_file(path) as content:
+        m = VERSION_ASSIGN_BYTES_RE.search(content)
+        if not m:
+            raise ValueError(f"Could not find __version__ assignment in {path}")
+        return m.group(2).decode("utf-8")
 
 
 def version_source_files(component: dict[str, Any]) -> list[str]:
@@ -214,15 +365,28 @@ def version_source_files(component: dict[str, Any]) -> list[str]:
     return files
 
 
+def _new_sha256() -> Any:
+    # The digest only fingerprints version sources, so OpenSSL may use its
+    # fastest (hardware-accelerated) backend even under FIPS restrictions.
+    if "sha256" in hashlib.algorithms_available:
+        try:
+            return hashlib.new("sha256", usedforsecurity=False)
+        except TypeError:  # pragma: no cover - Python < 3.9
+            pass
+    return hashlib.sha256()
+
+
 def digest_files(repo_root: Path, rel_files: list[str]) -> str:
-    h = hashlib.sha256()
+    h = _new_sha256()
     for rel_file in sorted(rel_files):
-        abs_path = repo_root / rel_file
-        if not abs_path.exists():
-            raise FileNotFoundError(f"Missing file for digest: {rel_file}")
         h.update(rel_file.encode("utf-8"))
         h.update(b"\x00")
-        h.update(abs_path.read_bytes())
+        # Let open() report a missing file rather than stat()ing it up front.
+        try:
+            with _mapped_file(repo_root / rel_file) as content:
+                h.update(content)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Missing file for digest: {rel_file}") from None
         h.update(b"\x00")
     return h.hexdigest()
 
@@ -236,24 +400,73 @@ def scope_map(config: dict[str, Any]) -> dict[str, str]:
     for component in config["components"]:
         scope = component.get("scope")
         if scope:
-            mapping[scope] = component["name"]
+            # Interned so lookups with interned commit scopes hit on identity.
+            mapping[sys.intern(scope) if isinstance(scope, str) else scope] = component["name"]
     return mapping
 
 
-def resolve_component_name(config: dict[str, Any], value: str) -> str:
-    components = component_map(config)
+def component_for_scope(scopes: dict[str, str], scope: str) -> str | None:
+    # Exact scope first, then the longest registered "/"-prefix, so nested
+    # scopes such as "tentacle/api" route to the "tentacle" component.
+    component_name = scopes.get(scope)
+    if component_name is not None or "/" not in scope:
+        return component_name
+    parts = scope.split("/")
+    for end in range(len(parts) - 1, 0, -1):
+        component_name = scopes.get("/".join(parts[:end]))
+        if component_name is not None:
+            return component_name
+    return None
+
+
+def resolve_component_name(
+    components: dict[str, dict[str, Any]],
+    scopes: dict[str, str],
+    value: str,
+) -> str:
     if value in components:
         return value
-    scopes = scope_map(config)
     if value in scopes:
         return scopes[value]
     raise ValueError(f"Unknown component or scope: {value}")
 
 
-def component_matches_file(component: dict[str, Any], rel_file: str) -> bool:
-    from fnmatch import fnmatch
+@lru_cache(maxsize=None)
+def _compile_path_globs(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+def component_path_matcher(component: dict[str, Any]) -> re.Pattern[str] | None:
+    return _compile_path_globs(tuple(component.get("path_globs", [])))
 
-    for pattern in component.get("path_globs", []):
-        if fnmatch(rel_file, pattern):
-            return True
-    return False
+
+def _glob_literal_segments(pattern: str) -> tuple[str, ...]:
+    segments: list[str] = []
+    for segment in pattern.split("/"):
+        if any(ch in segment for ch in "*?["):
+            break
+        segments.append(segment)
+    return tuple(segments)
+
+
+def component_path_index(
+    components: list[dict[str, Any]],
+) -> dict[tuple[str, ...], list[tuple[str, re.Pattern[str]]]]:
+    # Keyed on the literal leading directories of each glob: a file can only
+    # match components indexed under one of its own path prefixes.
+    index: dict[tuple[str, ...], list[tuple[str, re.Pattern[str]]]] = {}
+    for component in components:
+        matcher = component_path_matcher(component)
+        if matcher is None:
+            continue
+        entry = (component["name"], matcher)
+        for prefix in {_glob_literal_segments(pattern) for pattern in component.get("path_globs", [])}:
+            index.setdefault(prefix, []).append(entry)
+    return index
+
+
+def component_matches_file(component: dict[str, Any], rel_file: str) -> bool:
+    matcher = component_path_matcher(component)
+    return matcher is not None and matcher.match(rel_file) is not None
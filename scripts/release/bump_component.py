@@ -13,11 +13,17 @@ from _common import (
     load_yaml,
     read_component_version,
     resolve_component_name,
+    scope_map,
     write_component_version,
 )
+from update_manifest import run as update_manifest
 
 
-def run_update_manifest(config_path: str, manifest_path: str) -> None:
+def run_update_manifest(config_path: str, manifest_path: str, spawn: bool = False) -> None:
+    if not spawn:
+        update_manifest(config_path, manifest_path)
+        return
+
     update_manifest_script = Path(__file__).with_name("update_manifest.py")
     subprocess.run(
         [
@@ -39,14 +45,20 @@ def main() -> None:
     parser.add_argument("--bump", required=True, choices=["patch", "minor", "major"])
     parser.add_argument("--manifest", required=False)
     parser.add_argument("--no-update-manifest", action="store_true")
+    parser.add_argument(
+        "--spawn-update-manifest",
+        action="store_true",
+        help="Regenerate the manifest in a separate update_manifest.py process",
+    )
     parser.add_argument("--dry-run", action="store_true")
     parser.add_argument("--output", required=False)
     args = parser.parse_args()
 
     repo_root = Path(__file__).resolve().parents[2]
     config = load_yaml(repo_root / args.config)
-    component_name = resolve_component_name(config, args.component)
-    component = component_map(config)[component_name]
+    components = component_map(config)
+    component_name = resolve_component_name(components, scope_map(config), args.component)
+    component = components[component_name]
 
     bump = ensure_valid_bump(args.bump)
     current = read_component_version(repo_root, component)
@@ -73,7 +85,7 @@ def main() -> None:
         if not args.no_update_manifest:
             if not manifest_path:
                 manifest_path = config.get("release", {}).get("manifest_file", "manifest.yaml")
-            run_update_manifest(args.config, manifest_path)
+            run_update_manifest(args.config, manifest_path, spawn=args.spawn_update_manifest)
 
     if args.output:
         dump_json(Path(args.output), result)
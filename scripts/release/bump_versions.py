@@ -4,7 +4,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from _common import component_map, dump_json, load_json, load_yaml, read_component_version, write_component_version
+from _common import VersionDriftError, component_map, dump_json, load_json, load_yaml, rewrite_component_version
 
 
 def main() -> None:
@@ -26,14 +26,13 @@ def main() -> None:
         component = components_by_name[name]
 
         expected_current = item["current_version"]
-        current_now = read_component_version(repo_root, component)
-        if current_now != expected_current:
-            raise SystemExit(
-                f"Version drift for {name}: expected {expected_current}, found {current_now}."
-            )
-
         new_version = item["next_version"]
-        changed = write_component_version(repo_root, component, new_version)
+        try:
+            changed = rewrite_component_version(repo_root, component, expected_current, new_version)
+        except VersionDriftError as exc:
+            raise SystemExit(
+                f"Version drift for {name}: expected {exc.expected}, found {exc.found}."
+            ) from exc
         changed_files[name] = changed
         print(f"Bumped {name}: {expected_current} -> {new_version}")
 
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable
 
 from _common import (
     component_map,
@@ -13,81 +15,110 @@ from _common import (
 )
 
 
-def validate_component_versions(repo_root: Path, config: dict) -> list[str]:
+def _map_components(
+    check: Callable[[str, dict], list[str]],
+    components: dict[str, dict],
+) -> list[str]:
+    # Components are independent and the checks are file-I/O bound, so run
+    # them concurrently; map() keeps the results in sorted component order.
+    items = sorted(components.items())
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(16, len(items))) as executor:
+        results = executor.map(lambda item: check(*item), items)
+        return [error for errors in results for error in errors]
+
+
+def _validate_component_version(repo_root: Path, component_name: str, component: dict) -> list[str]:
     errors: list[str] = []
 
-    for component_name, component in sorted(component_map(config).items()):
+    try:
+        version = read_component_version(repo_root, component)
+        ensure_semver(version)
+    except Exception as exc:  # noqa: BLE001
+        return [f"{component_name}: invalid source version ({exc})"]
+
+    version_file = repo_root / component["version"]["file"]
+    if not version_file.exists():
+        errors.append(f"{component_name}: missing version file {component['version']['file']}")
+
+    for runtime_file in component.get("runtime_version_files", []):
+        runtime_path = repo_root / runtime_file
+        if not runtime_path.exists():
+            errors.append(f"{component_name}: missing runtime version file {runtime_file}")
+            continue
+
         try:
-            version = read_component_version(repo_root, component)
-            ensure_semver(version)
+            runtime_version = read_runtime_file_version(runtime_path)
         except Exception as exc:  # noqa: BLE001
-            errors.append(f"{component_name}: invalid source version ({exc})")
+            errors.append(f"{component_name}: could not parse {runtime_file} ({exc})")
             continue
 
-        version_file = repo_root / component["version"]["file"]
-        if not version_file.exists():
-            errors.append(f"{component_name}: missing version file {component['version']['file']}")
-
-        for runtime_file in component.get("runtime_version_files", []):
-            runtime_path = repo_root / runtime_file
-            if not runtime_path.exists():
-                errors.append(f"{component_name}: missing runtime version file {runtime_file}")
-                continue
+        if runtime_version != version:
+            errors.append(
+                f"{component_name}: runtime version drift in {runtime_file} "
+                f"(expected {version}, found {runtime_version})"
+            )
 
-            try:
-                runtime_version = read_runtime_file_version(runtime_path)
-            except Exception as exc:  # noqa: BLE001
-                errors.append(f"{component_name}: could not parse {runtime_file} ({exc})")
-                continue
+    return errors
 
-            if runtime_version != version:
-                errors.append(
-                    f"{component_name}: runtime version drift in {runtime_file} "
-                    f"(expected {version}, found {runtime_version})"
-                )
 
-    return errors
+def validate_component_versions(repo_root: Path, components: dict[str, dict]) -> list[str]:
+    return _map_components(
+        lambda name, component: _validate_component_version(repo_root, name, component),
+        components,
+    )
 
 
-def validate_manifest(repo_root: Path, config: dict, manifest_path: Path) -> list[str]:
+def validate_manifest(repo_root: Path, components: dict[str, dict], manifest_path: Path) -> list[str]:
     if not manifest_path.exists():
         return [f"manifest file does not exist: {manifest_path}"]
 
     manifest = load_yaml(manifest_path)
-    errors: list[str] = []
 
     if "components" not in manifest or not isinstance(manifest["components"], dict):
         return [f"manifest missing components map: {manifest_path}"]
 
-    components = component_map(config)
+    return _map_components(
+        lambda name, component: _validate_manifest_component(
+            repo_root, name, component, manifest["components"].get(name)
+        ),
+        components,
+    )
 
-    for name, component in sorted(components.items()):
-        manifest_component = manifest["components"].get(name)
-        if not manifest_component:
-            errors.append(f"manifest missing component: {name}")
-            continue
 
-        source_version = read_component_version(repo_root, component)
-        manifest_version = str(manifest_component.get("version", ""))
-        if source_version != manifest_version:
-            errors.append(
-                f"manifest version mismatch for {name}: "
-                f"source={source_version}, manifest={manifest_version}"
-            )
+def _validate_manifest_component(
+    repo_root: Path,
+    name: str,
+    component: dict,
+    manifest_component: dict | None,
+) -> list[str]:
+    if not manifest_component:
+        return [f"manifest missing component: {name}"]
 
-        source_scope = component.get("scope")
-        manifest_scope = manifest_component.get("scope")
-        if source_scope != manifest_scope:
-            errors.append(
-                f"manifest scope mismatch for {name}: source={source_scope}, manifest={manifest_scope}"
-            )
+    errors: list[str] = []
 
-        source_kind = component.get("kind")
-        manifest_kind = manifest_component.get("kind")
-        if source_kind != manifest_kind:
-            errors.append(
-                f"manifest kind mismatch for {name}: source={source_kind}, manifest={manifest_kind}"
-            )
+    source_version = read_component_version(repo_root, component)
+    manifest_version = str(manifest_component.get("version", ""))
+    if source_version != manifest_version:
+        errors.append(
+            f"manifest version mismatch for {name}: "
+            f"source={source_version}, manifest={manifest_version}"
+        )
+
+    source_scope = component.get("scope")
+    manifest_scope = manifest_component.get("scope")
+    if source_scope != manifest_scope:
+        errors.append(
+            f"manifest scope mismatch for {name}: source={source_scope}, manifest={manifest_scope}"
+        )
+
+    source_kind = component.get("kind")
+    manifest_kind = manifest_component.get("kind")
+    if source_kind != manifest_kind:
+        errors.append(
+            f"manifest kind mismatch for {name}: source={source_kind}, manifest={manifest_kind}"
+        )
 
     return errors
 
@@ -100,11 +131,12 @@ def main() -> None:
 
     repo_root = Path(__file__).resolve().parents[2]
     config = load_yaml(repo_root / args.config)
+    components = component_map(config)
 
-    errors = validate_component_versions(repo_root, config)
+    errors = validate_component_versions(repo_root, components)
 
     if args.manifest:
-        errors.extend(validate_manifest(repo_root, config, repo_root / args.manifest))
+        errors.extend(validate_manifest(repo_root, components, repo_root / args.manifest))
 
     if errors:
         print("Version sync validation failed:")
@@ -4,12 +4,15 @@ from __future__ import annotations
 import argparse
 import re
 import subprocess
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
 
 from _common import (
     bump_rank,
     bump_semver,
+    component_for_scope,
     component_map,
     dump_json,
     load_json,
@@ -19,25 +22,60 @@ from _common import (
 )
 
 HEADER_RE = re.compile(
-    r"^(?P<type>[a-z]+)(\((?P<scope>[a-z0-9][a-z0-9\-/]*)\))?(?P<bang>!)?:\s.+$"
+    r"^(?P<type>[a-z]+)(?:\((?P<scope>[a-z0-9][a-z0-9\-/]*)\))?(?P<bang>!)?:\s.+\Z"
 )
+BREAKING_RE = re.compile(r"BREAKING[ -]CHANGE")
 
 
-def get_commits(base: str, head: str) -> list[dict[str, str]]:
-    fmt = "%H%x1f%s%x1f%b%x1e"
-    cmd = ["git", "log", "--format=" + fmt, f"{base}..{head}"]
-    proc = subprocess.run(cmd, check=True, capture_output=True, text=True)
+GIT_LOG_READ_SIZE = 1 << 16
+# Coarse POSIX ERE prefilter so git drops non-conventional commits itself. It
+# accepts a superset of HEADER_RE (and matches any message line, not just the
+# subject), so HEADER_RE still decides; no PCRE-enabled git build is required.
+GIT_LOG_GREP = r"^[a-z]+(\([a-z0-9][a-z0-9/-]*\))?!?:"
+
+
+def _commit_from_fields(commit_hash: bytes, subject: bytes, body: bytes) -> dict[str, str]:
+    return {
+        "hash": commit_hash.decode("ascii").strip(),
+        "subject": subject.decode("utf-8", "replace").strip(),
+        "body": body.decode("utf-8", "replace").strip(),
+    }
 
-    commits: list[dict[str, str]] = []
-    for record in proc.stdout.split("\x1e"):
-        if not record.strip():
-            continue
-        parts = record.strip("\n").split("\x1f")
-        if len(parts) != 3:
-            continue
-        commit_hash, subject, body = parts
-        commits.append({"hash": commit_hash, "subject": subject.strip(), "body": body.strip()})
-    return commits
+
+def get_commits(base: str, head: str) -> Iterator[dict[str, str]]:
+    # Stream NUL-terminated fields as git produces them instead of buffering
+    # the whole log; with -z every commit is exactly hash, subject, body.
+    fmt = "%H%x00%s%x00%b"
+    cmd = [
+        "git",
+        "log",
+        "-z",
+        "--extended-regexp",
+        "--grep=" + GIT_LOG_GREP,
+        "--format=" + fmt,
+        f"{base}..{head}",
+    ]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+    assert proc.stdout is not None
+
+    try:
+        fields: list[bytes] = []
+        pending = b""
+        while chunk := proc.stdout.read(GIT_LOG_READ_SIZE):
+            *complete, pending = (pending + chunk).split(b"\0")
+            fields.extend(complete)
+            usable = len(fields) - len(fields) % 3
+            for i in range(0, usable, 3):
+                yield _commit_from_fields(fields[i], fields[i + 1], fields[i + 2])
+            del fields[:usable]
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.terminate()
+        returncode = proc.wait()
+
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
 
 
 def main() -> None:
@@ -60,12 +98,19 @@ def main() -> None:
     computed_bumps: dict[str, str] = {}
     rationale: dict[str, list[str]] = {}
 
-    commits = get_commits(args.base, args.head)
-
-    type_bumps = config["commit"]["type_bumps"]
+    # The working set of types and scopes is tiny while commit ranges can be
+    # large, so intern both sides of the per-commit dict lookups.
+    type_bumps = {sys.intern(str(k)): v for k, v in config["commit"]["type_bumps"].items()}
     require_scope = bool(config["commit"].get("require_scope", True))
     fallback_bump = config["commit"].get("default_bump_for_changed_component", "patch")
 
+    # Bound once: looked up for every commit in the range.
+    bump_for_type = type_bumps.get
+
+    # No mapped paths changed (e.g. docs-only ranges): every commit would be
+    # filtered out below, so don't pay for walking the range at all.
+    commits = get_commits(args.base, args.head) if changed_components else ()
+
     for commit in commits:
         subject = commit["subject"]
         body = commit["body"]
@@ -73,19 +118,19 @@ def main() -> None:
         if not m:
             continue
 
-        commit_type = m.group("type")
-        scope = m.group("scope")
+        commit_type = sys.intern(m.group("type"))
+        scope = sys.intern(m.group("scope") or "")
         bang = bool(m.group("bang"))
 
         if require_scope and not scope:
             continue
 
-        component_name = scopes.get(scope or "")
+        component_name = component_for_scope(scopes, scope)
         if not component_name or component_name not in changed_components:
             continue
 
-        bump = type_bumps.get(commit_type, "patch")
-        if bang or "BREAKING CHANGE" in body or "BREAKING-CHANGE" in body:
+        bump = bump_for_type(commit_type, "patch")
+        if bang or BREAKING_RE.search(body):
             bump = "major"
 
         prev = computed_bumps.get(component_name)
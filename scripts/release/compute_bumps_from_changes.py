@@ -16,6 +16,7 @@ from _common import (
     load_yaml,
     read_component_version,
     resolve_component_name,
+    scope_map,
 )
 
 
@@ -67,6 +68,7 @@ def main() -> None:
     repo_root = Path(__file__).resolve().parents[2]
     config = load_yaml(repo_root / args.config)
     components = component_map(config)
+    scopes = scope_map(config)
 
     notes_dir = (repo_root / args.changes_dir).resolve()
     if not notes_dir.exists():
@@ -97,7 +99,8 @@ def main() -> None:
     reasons: dict[str, list[str]] = {}
 
     for note in notes:
-        component_name = resolve_component_name(config, note["component"])
+        component_name = resolve_component_name(components, scopes, note["component"])
+        note["component_name"] = component_name
         if changed_filter is not None and component_name not in changed_filter:
             continue
 
@@ -138,7 +141,7 @@ def main() -> None:
         "notes": [
             {
                 "file": Path(note["file"]).name,
-                "component": resolve_component_name(config, note["component"]),
+                "component": note["component_name"],
                 "bump": note["bump"],
                 "summary": note["summary"],
             }
@@ -2,16 +2,19 @@
 from __future__ import annotations
 
 import argparse
+import re
 import subprocess
 from pathlib import Path
 
-from _common import component_matches_file, dump_json, load_yaml
+from _common import component_path_index, dump_json, load_yaml
 
 
 def git_changed_files(base: str, head: str) -> list[str]:
-    cmd = ["git", "diff", "--name-only", base, head]
-    proc = subprocess.run(cmd, check=True, capture_output=True, text=True)
-    return [line.strip() for line in proc.stdout.splitlines() if line.strip()]
+    # -z emits raw NUL-terminated paths, so names with newlines or non-ASCII
+    # bytes are neither quoted nor split.
+    cmd = ["git", "diff", "-z", "--name-only", base, head]
+    proc = subprocess.run(cmd, check=True, capture_output=True)
+    return [name.decode("utf-8", "replace") for name in proc.stdout.split(b"\x00") if name]
 
 
 def main() -> None:
@@ -27,13 +30,21 @@ def main() -> None:
 
     changed_files = git_changed_files(args.base, args.head)
 
+    # Compile each component's globs once and index them by literal path
+    # prefix; each file then only runs the matchers of components that share
+    # one of its leading directories.
+    index = component_path_index(config["components"])
+
     changed_components: set[str] = set()
     component_files: dict[str, list[str]] = {}
 
     for rel_file in changed_files:
-        for component in config["components"]:
-            if component_matches_file(component, rel_file):
-                name = component["name"]
+        segments = tuple(rel_file.split("/"))
+        candidates: dict[str, re.Pattern[str]] = {}
+        for depth in range(len(segments) + 1):
+            candidates.update(index.get(segments[:depth], ()))
+        for name, matcher in candidates.items():
+            if matcher.match(rel_file):
                 changed_components.add(name)
                 component_files.setdefault(name, []).append(rel_file)
 
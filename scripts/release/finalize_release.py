@@ -2,18 +2,32 @@
 from __future__ import annotations
 
 import argparse
+import errno
+import os
 import shutil
 from datetime import datetime, timezone
+from fnmatch import fnmatch
 from pathlib import Path
 
-from _common import dump_json, load_json, load_yaml
+from _common import atomic_write_bytes, dump_json, load_json, load_yaml
 
 
-def load_pending_note_summaries(notes_dir: Path) -> list[dict[str, str]]:
+def scan_pending_notes(notes_dir: Path) -> list[Path]:
+    try:
+        with os.scandir(notes_dir) as entries:
+            names = [
+                entry.name
+                for entry in entries
+                if fnmatch(entry.name, "*.y*ml") and not entry.name.startswith("_")
+            ]
+    except FileNotFoundError:
+        return []
+    return [notes_dir / name for name in sorted(names)]
+
+
+def load_pending_note_summaries(note_paths: list[Path]) -> list[dict[str, str]]:
     notes: list[dict[str, str]] = []
-    for path in sorted(notes_dir.glob("*.y*ml")):
-        if path.name.startswith("_"):
-            continue
+    for path in note_paths:
         data = load_yaml(path)
         if not isinstance(data, dict):
             continue
@@ -43,18 +57,21 @@ def prepend_changelog_entry(changelog_path: Path, entry: str) -> None:
             content = entry.strip() + "\n\n" + previous + "\n"
     else:
         content = "# Platform Changelog\n\n" + entry.strip() + "\n"
-    changelog_path.write_text(content, encoding="utf-8")
+    atomic_write_bytes(changelog_path, content.encode("utf-8"))
 
 
-def archive_notes(notes_dir: Path, archive_dir: Path) -> list[str]:
+def archive_notes(note_paths: list[Path], archive_dir: Path) -> list[str]:
     archive_dir.mkdir(parents=True, exist_ok=True)
     archived: list[str] = []
 
-    for path in sorted(notes_dir.glob("*.y*ml")):
-        if path.name.startswith("_"):
-            continue
+    for path in note_paths:
         dest = archive_dir / path.name
-        shutil.move(str(path), dest)
+        try:
+            os.rename(path, dest)
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
+            shutil.move(str(path), dest)
         archived.append(str(dest))
 
     return archived
@@ -116,8 +133,10 @@ def main() -> None:
     if not platform_release:
         raise SystemExit("manifest is missing platform_release")
 
-    release_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    notes = load_pending_note_summaries(changes_dir)
+    now = datetime.now(timezone.utc)
+    release_date = now.strftime("%Y-%m-%d")
+    note_paths = scan_pending_notes(changes_dir)
+    notes = load_pending_note_summaries(note_paths)
 
     changelog_entry = build_changelog_entry(
         platform_release,
@@ -128,10 +147,10 @@ def main() -> None:
     prepend_changelog_entry(changelog_path, changelog_entry)
 
     archive_dir = archive_root / platform_release
-    archived_files = archive_notes(changes_dir, archive_dir)
+    archived_files = archive_notes(note_paths, archive_dir)
 
     release_plan = {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": now.isoformat(),
         "platform_release": platform_release,
         "git_sha": manifest.get("git_sha"),
         "manifest": args.manifest,
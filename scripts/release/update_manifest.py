@@ -20,8 +20,7 @@ def git_sha() -> str:
     return proc.stdout.strip()
 
 
-def next_platform_release_id(existing_manifest: dict[str, Any] | None) -> str:
-    now = datetime.now(timezone.utc)
+def next_platform_release_id(existing_manifest: dict[str, Any] | None, now: datetime) -> str:
     date_prefix = now.strftime("platform-%Y.%m.%d")
 
     if not existing_manifest:
@@ -64,17 +63,11 @@ def component_manifest_entry(repo_root: Path, component: dict[str, Any]) -> dict
     }
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Generate platform release manifest")
-    parser.add_argument("--config", required=True)
-    parser.add_argument("--output", default="manifest.yaml")
-    parser.add_argument("--platform-release", required=False)
-    args = parser.parse_args()
-
+def run(config_path: str, output: str, platform_release: str | None = None) -> None:
     repo_root = Path(__file__).resolve().parents[2]
-    config = load_yaml(repo_root / args.config)
+    config = load_yaml(repo_root / config_path)
 
-    output_path = (repo_root / args.output).resolve()
+    output_path = (repo_root / output).resolve()
     existing = load_yaml(output_path) if output_path.exists() else None
 
     components = component_map(config)
@@ -83,23 +76,33 @@ def main() -> None:
         component = components[name]
         manifest_components[name] = component_manifest_entry(repo_root, component)
 
-    platform_release = args.platform_release or next_platform_release_id(existing)
+    # One clock read so the release id's date and generated_at always agree,
+    # even across midnight UTC.
+    now = datetime.now(timezone.utc)
+    platform_release = platform_release or next_platform_release_id(existing, now)
 
     manifest = {
         "schema_version": 2,
-        "generated_at": datetime.now(timezone.utc)
-        .replace(microsecond=0)
-        .isoformat()
-        .replace("+00:00", "Z"),
+        "generated_at": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
         "platform_release": platform_release,
         "git_sha": git_sha(),
         "components": manifest_components,
     }
 
     dump_yaml(output_path, manifest)
-    print(f"Updated manifest: {args.output}")
+    print(f"Updated manifest: {output}")
     print(f"Platform release: {manifest['platform_release']}")
 
 
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate platform release manifest")
+    parser.add_argument("--config", required=True)
+    parser.add_argument("--output", default="manifest.yaml")
+    parser.add_argument("--platform-release", required=False)
+    args = parser.parse_args()
+
+    run(args.config, args.output, args.platform_release)
+
+
 if __name__ == "__main__":
     main()
@@ -7,7 +7,7 @@ from fnmatch import fnmatch
 from pathlib import Path
 from typing import Any
 
-from _common import component_map, load_json, load_yaml, resolve_component_name, version_source_files
+from _common import component_map, load_json, load_yaml, resolve_component_name, scope_map, version_source_files
 
 VALID_BUMPS = {"patch", "minor", "major"}
 
@@ -68,8 +68,9 @@ def main() -> None:
     config = load_yaml(repo_root / args.config)
     changed = load_json(Path(args.changed))
 
-    component_names = set(component_map(config).keys())
     components = component_map(config)
+    component_names = set(components)
+    scopes = scope_map(config)
     changed_components = set(changed.get("components", []))
     changed_component_files: dict[str, list[str]] = changed.get("component_files", {})
 
@@ -105,7 +106,7 @@ def main() -> None:
 
         try:
             note = parse_note(note_path)
-            component_name = resolve_component_name(config, note["component"])
+            component_name = resolve_component_name(components, scopes, note["component"])
             if component_name not in component_names:
                 raise ValueError(f"unknown component: {note['component']}")
             noted_components.add(component_name)